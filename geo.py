@@ -1,7 +1,16 @@
 import math
+from collections import namedtuple
 from datetime import time
+from functools import lru_cache
+
+import numpy as np
 
 R = 6371  # Radius of the Earth in Km
+DEG = math.pi / 180  # Radians per degree
+_CARDINALS = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+
+# Vectors stored as one float64 array per axis
+CoordBuffer = namedtuple('CoordBuffer', ['x', 'y', 'z'])
 
 
 def magnitude(v: tuple) -> float:
@@ -10,7 +19,7 @@ def magnitude(v: tuple) -> float:
     :param v: tuple of n elements
     :return: float
     """
-    return math.sqrt(sum([a ** 2 for a in v]))
+    return math.hypot(*v)
 
 
 def dot_product(v: tuple, w: tuple) -> float:
@@ -23,7 +32,26 @@ def dot_product(v: tuple, w: tuple) -> float:
     """
     if len(v) != len(w):
         raise ValueError('Vectors must have the same length')
-    return sum([a * b for a, b in zip(v, w)])
+    return sum(a * b for a, b in zip(v, w))
+
+
+def _mag3(v: tuple) -> float:
+    """
+    Calculate the magnitude of a 3-element vector without the generic loop
+    :param v: tuple of 3 elements
+    :return: float
+    """
+    return math.hypot(v[0], v[1], v[2])
+
+
+def _dot3(v: tuple, w: tuple) -> float:
+    """
+    Calculate the dot product of two 3-element vectors without the generic loop
+    :param v: tuple of 3 elements
+    :param w: tuple of 3 elements
+    :return: float
+    """
+    return v[0] * w[0] + v[1] * w[1] + v[2] * w[2]
 
 
 def cross_product(v: tuple, w: tuple) -> tuple:
@@ -42,6 +70,7 @@ def cross_product(v: tuple, w: tuple) -> tuple:
     return x, y, z
 
 
+@lru_cache(maxsize=256)
 def to_vector(lat: float, long: float) -> tuple:
     """
     Convert latitude and longitude to a vector
@@ -54,12 +83,64 @@ def to_vector(lat: float, long: float) -> tuple:
         raise ValueError('Latitude must be between -90 and 90')
     if long < -180 or long > 180:
         raise ValueError('Longitude must be between -180 and 180')
-    x = R * math.cos(math.radians(lat)) * math.cos(math.radians(long))
-    y = R * math.cos(math.radians(lat)) * math.sin(math.radians(long))
-    z = R * math.sin(math.radians(lat))
+    lat_rad = lat * DEG
+    long_rad = long * DEG
+    cos_lat = math.cos(lat_rad)
+    x = R * cos_lat * math.cos(long_rad)
+    y = R * cos_lat * math.sin(long_rad)
+    z = R * math.sin(lat_rad)
     return x, y, z
 
 
+def _radians_batch(lats: np.ndarray, longs: np.ndarray) -> tuple:
+    """
+    Validate arrays of latitudes and longitudes and convert them to radians
+    :param lats: array of N latitudes in degrees (-90.0 to 90.0)
+    :param longs: array of N longitudes in degrees (-180.0 to 180.0)
+    :return: tuple of 2 float64 arrays (latitudes, longitudes) in radians
+    :throws ValueError if any latitude or longitude is out of range or the arrays have different lengths
+    """
+    lats = np.asarray(lats, dtype=np.float64).ravel()
+    longs = np.asarray(longs, dtype=np.float64).ravel()
+    if lats.size != longs.size:
+        raise ValueError('Latitudes and longitudes must have the same length')
+    if np.any(lats < -90) or np.any(lats > 90):
+        raise ValueError('Latitude must be between -90 and 90')
+    if np.any(longs < -180) or np.any(longs > 180):
+        raise ValueError('Longitude must be between -180 and 180')
+    return np.deg2rad(lats), np.deg2rad(longs)
+
+
+def to_vector_batch(lats: np.ndarray, longs: np.ndarray) -> np.ndarray:
+    """
+    Convert arrays of latitudes and longitudes to vectors
+    :param lats: array of N latitudes in degrees (-90.0 to 90.0)
+    :param longs: array of N longitudes in degrees (-180.0 to 180.0)
+    :return: ndarray of shape (N, 3) with the (x, y, z) vectors in Km from the center of the Earth
+    :throws ValueError if any latitude or longitude is out of range or the arrays have different lengths
+    """
+    lat, lon = _radians_batch(lats, longs)
+    cos_lat = np.cos(lat)
+    result = np.empty((lat.size, 3))
+    result[:, 0] = R * cos_lat * np.cos(lon)
+    result[:, 1] = R * cos_lat * np.sin(lon)
+    result[:, 2] = R * np.sin(lat)
+    return result
+
+
+def to_coord_buffer(lats: np.ndarray, longs: np.ndarray) -> CoordBuffer:
+    """
+    Convert arrays of latitudes and longitudes to vectors stored as one array per axis
+    :param lats: array of N latitudes in degrees (-90.0 to 90.0)
+    :param longs: array of N longitudes in degrees (-180.0 to 180.0)
+    :return: CoordBuffer with N-element x, y and z arrays in Km from the center of the Earth
+    :throws ValueError if any latitude or longitude is out of range or the arrays have different lengths
+    """
+    lat, lon = _radians_batch(lats, longs)
+    cos_lat = np.cos(lat)
+    return CoordBuffer(R * cos_lat * np.cos(lon), R * cos_lat * np.sin(lon), R * np.sin(lat))
+
+
 def angle_vectors(v: tuple, w: tuple) -> float:
     """
     Calculate the angle between two vectors in radians
@@ -70,9 +151,16 @@ def angle_vectors(v: tuple, w: tuple) -> float:
     """
     if len(v) != len(w):
         raise ValueError('Vectors must have the same length')
-    if magnitude(v) == 0 or magnitude(w) == 0:
+    if len(v) == 3:
+        # atan2 stays accurate near 0 and pi, where acos of the cosine loses precision
+        return math.atan2(_mag3(cross_product(v, w)), _dot3(v, w))
+    mv, mw = magnitude(v), magnitude(w)
+    if mv == 0 or mw == 0:
         return 0
-    return math.acos(round(dot_product(v, w) / (magnitude(v) * magnitude(w)), 5))
+    cosine = dot_product(v, w) / (mv * mw)
+    # Clamp rounding errors outside the acos domain
+    cosine = 1.0 if cosine > 1.0 else (-1.0 if cosine < -1.0 else cosine)
+    return math.acos(cosine)
 
 
 def angle_between_coordinates(lat1: float, long1: float, lat2: float, long2: float) -> float:
@@ -90,6 +178,21 @@ def angle_between_coordinates(lat1: float, long1: float, lat2: float, long2: flo
     return angle_vectors(u, v)
 
 
+def angle_between_coordinates_batch(a: CoordBuffer, b: CoordBuffer) -> np.ndarray:
+    """
+    Calculate the angles between two sets of coordinates in radians
+    :param a: CoordBuffer of N vectors (or 1, broadcast against b)
+    :param b: CoordBuffer of N vectors (or 1, broadcast against a)
+    :return: array of N angles in radians
+    """
+    # Same atan2(|a x b|, a . b) form as angle_vectors, accurate for nearby points
+    cx = a.y * b.z - a.z * b.y
+    cy = a.z * b.x - a.x * b.z
+    cz = a.x * b.y - a.y * b.x
+    dot = a.x * b.x + a.y * b.y + a.z * b.z
+    return np.arctan2(np.sqrt(cx * cx + cy * cy + cz * cz), dot)
+
+
 def distance_between_coordinates(lat1: float, long1: float, lat2: float, long2: float) -> float:
     """
     Calculate the distance between two coordinates
@@ -104,6 +207,33 @@ def distance_between_coordinates(lat1: float, long1: float, lat2: float, long2:
     return angle * R
 
 
+def distance_between_coordinates_batch(a: CoordBuffer, b: CoordBuffer) -> np.ndarray:
+    """
+    Calculate the distances between two sets of coordinates
+    :param a: CoordBuffer of N vectors (or 1, broadcast against b)
+    :param b: CoordBuffer of N vectors (or 1, broadcast against a)
+    :return: array of N distances in Km
+    """
+    return angle_between_coordinates_batch(a, b) * R
+
+
+def distances_to_points(lat0: float, long0: float, lats: np.ndarray, longs: np.ndarray) -> np.ndarray:
+    """
+    Calculate the distances from one coordinate to many others, e.g. an observer to the ISS ground track
+    :param lat0: float latitude in degrees (-90.0 to 90.0)
+    :param long0: float longitude in degrees (-180.0 to 180.0)
+    :param lats: array of N latitudes in degrees (-90.0 to 90.0)
+    :param longs: array of N longitudes in degrees (-180.0 to 180.0)
+    :return: array of N distances in Km
+    :throws ValueError if any latitude or longitude is out of range or the arrays have different lengths
+    """
+    v0 = np.asarray(to_vector(lat0, long0))
+    vectors = to_vector_batch(lats, longs)
+    cross = np.cross(vectors, v0)
+    dot = vectors @ v0
+    return np.arctan2(np.sqrt(np.einsum('ij,ij->i', cross, cross)), dot) * R
+
+
 def direction_between_coordinates(lat1: float, long1: float, lat2: float, long2: float) -> tuple:
     """
     Calculate the direction between two coordinates
@@ -117,11 +247,49 @@ def direction_between_coordinates(lat1: float, long1: float, lat2: float, long2:
     """
     v = to_vector(lat1, long1)
     w = to_vector(lat2, long2)
-    result = cross_product(cross_product(v, w), v)
-    if magnitude(result) < 1:
-        return cross_product(cross_product(v, (0, 0, 1)), v)
-    else:
-        return result
+    return _direction(v, cross_product(v, w))
+
+
+def _direction(v: tuple, vxw: tuple, north_vector: tuple = None) -> tuple:
+    """
+    Calculate the direction from v towards w reusing an already computed v x w
+    :param v: tuple of 3 elements, the starting point
+    :param vxw: tuple of 3 elements, the cross product of v and the destination w
+    :param north_vector: tuple of 3 elements, the local north at v if the caller already has it
+    :return: tuple of 3 elements (x, y, z) tangent to the surface of the Earth at v,
+    pointing north when v and w are the same or opposite points
+    """
+    result = cross_product(vxw, v)
+    if _mag3(result) < 1:
+        return north_vector if north_vector is not None else _local_north(v)
+    return result
+
+
+@lru_cache(maxsize=64)
+def _local_north(v: tuple) -> tuple:
+    """
+    Calculate the vector pointing north over the surface of the Earth at v, memoized for fixed observers
+    :param v: tuple of 3 elements
+    :return: tuple of 3 elements (x, y, z) tangent to the surface of the Earth at v
+    """
+    return cross_product(cross_product(v, (0, 0, 1)), v)
+
+
+def _bearing_core(lat1: float, long1: float, lat2: float, long2: float) -> float:
+    """
+    Calculate the angle between the local north and the direction to the second coordinate,
+    converting each coordinate to a vector only once
+    :param lat1: float latitude in degrees (-90.0 to 90.0)
+    :param long1: float longitude in degrees (-180.0 to 180.0)
+    :param lat2: float latitude in degrees (-90.0 to 90.0)
+    :param long2: float longitude in degrees (-180.0 to 180.0)
+    :return: float angle in radians (0 to pi)
+    """
+    v = to_vector(lat1, long1)
+    w = to_vector(lat2, long2)
+    north_vector = _local_north(v)
+    direction = _direction(v, cross_product(v, w), north_vector)
+    return angle_vectors(direction, north_vector)
 
 
 def bearing_between_coordinates(lat1: float, long1: float, lat2: float, long2: float) -> float:
@@ -133,10 +301,7 @@ def bearing_between_coordinates(lat1: float, long1: float, lat2: float, long2: f
     :param long2: float longitude in degrees (-180.0 to 180.0)
     :return: float bearing in degrees
     """
-    v = to_vector(lat1, long1)
-    north_vector = cross_product(cross_product(v, (0, 0, 1)), v)
-    w = direction_between_coordinates(lat1, long1, lat2, long2)
-    bearing = math.degrees(angle_vectors(w, north_vector))
+    bearing = math.degrees(_bearing_core(lat1, long1, lat2, long2))
     if long2 < long1:
         bearing = 360 - bearing
     return bearing
@@ -148,6 +313,5 @@ def cardinal_from_angle(angle: float) -> str:
     :param angle: float angle in degrees (0 to 360) where 0 is North
     :return: str cardinal direction
     """
-    cardinals = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW', 'N']
-    return cardinals[round(angle / 45)]
+    return _CARDINALS[round(angle / 45) % 8]
 
@@ -0,0 +1,183 @@
+import math
+
+import numpy as np
+from numba import njit, prange
+
+R = 6371.0  # Radius of the Earth in Km
+H = 408.0  # Height of the ISS in Km
+
+_vector = 'UniTuple(float64, 3)'
+
+
+@njit(f'float64({_vector})', cache=True, fastmath=True)
+def magnitude3(v: tuple) -> float:
+    """
+    Calculate the magnitude of a 3-element vector
+    :param v: tuple of 3 floats
+    :return: float
+    """
+    return math.sqrt(v[0] * v[0] + v[1] * v[1] + v[2] * v[2])
+
+
+@njit(f'float64({_vector}, {_vector})', cache=True, fastmath=True)
+def dot3(v: tuple, w: tuple) -> float:
+    """
+    Calculate the dot product of two 3-element vectors
+    :param v: tuple of 3 floats
+    :param w: tuple of 3 floats
+    :return: float
+    """
+    return v[0] * w[0] + v[1] * w[1] + v[2] * w[2]
+
+
+@njit(f'{_vector}({_vector}, {_vector})', cache=True, fastmath=True)
+def cross3(v: tuple, w: tuple) -> tuple:
+    """
+    Calculate the cross product of two 3-element vectors
+    :param v: tuple of 3 floats
+    :param w: tuple of 3 floats
+    :return: tuple of 3 floats perpendicular to the plane formed by v and w
+    """
+    return (v[1] * w[2] - v[2] * w[1],
+            v[2] * w[0] - v[0] * w[2],
+            v[0] * w[1] - v[1] * w[0])
+
+
+@njit(f'{_vector}(float64, float64)', cache=True, fastmath=True)
+def _to_vector_unchecked(lat: float, long: float) -> tuple:
+    """
+    Convert latitude and longitude to a vector without range checks, safe to call inside prange
+    :param lat: float latitude in degrees, already validated
+    :param long: float longitude in degrees, already validated
+    :return: tuple of 3 floats (x, y, z) in Km from the center of the Earth
+    """
+    # Each sin/cos pair shares its argument so LLVM can lower it to a single sincos call
+    lat_rad = math.radians(lat)
+    sin_lat, cos_lat = math.sin(lat_rad), math.cos(lat_rad)
+    long_rad = math.radians(long)
+    sin_long, cos_long = math.sin(long_rad), math.cos(long_rad)
+    return R * cos_lat * cos_long, R * cos_lat * sin_long, R * sin_lat
+
+
+@njit(f'{_vector}(float64, float64)', cache=True, fastmath=True)
+def to_vector_scalar(lat: float, long: float) -> tuple:
+    """
+    Convert latitude and longitude to a vector
+    :param lat: float latitude in degrees (-90.0 to 90.0)
+    :param long: float longitude in degrees (-180.0 to 180.0)
+    :return: tuple of 3 floats (x, y, z) in Km from the center of the Earth
+    :throws ValueError if the latitude or longitude are out of range
+    """
+    if lat < -90 or lat > 90:
+        raise ValueError('Latitude must be between -90 and 90')
+    if long < -180 or long > 180:
+        raise ValueError('Longitude must be between -180 and 180')
+    return _to_vector_unchecked(lat, long)
+
+
+@njit(f'float64({_vector}, {_vector})', cache=True, fastmath=True)
+def angle_vectors3(v: tuple, w: tuple) -> float:
+    """
+    Calculate the angle between two 3-element vectors in radians
+    :param v: tuple of 3 floats
+    :param w: tuple of 3 floats
+    :return: float angle in radians
+    """
+    # atan2 stays accurate near 0 and pi, where acos of the cosine loses precision
+    return math.atan2(magnitude3(cross3(v, w)), dot3(v, w))
+
+
+@njit('float64(float64, float64, float64, float64)', cache=True, fastmath=True)
+def angle_between_coordinates(lat1: float, long1: float, lat2: float, long2: float) -> float:
+    """
+    Calculate the angle between two coordinates in radians
+    :param lat1: float latitude in degrees (-90.0 to 90.0)
+    :param long1: float longitude in degrees (-180.0 to 180.0)
+    :param lat2: float latitude in degrees (-90.0 to 90.0)
+    :param long2: float longitude in degrees (-180.0 to 180.0)
+    :return: float angle in radians
+    :throws ValueError if the latitude or longitude are out of range
+    """
+    return angle_vectors3(to_vector_scalar(lat1, long1), to_vector_scalar(lat2, long2))
+
+
+@njit(f'{_vector}(float64, float64, float64, float64)', cache=True, fastmath=True)
+def direction_between_coordinates(lat1: float, long1: float, lat2: float, long2: float) -> tuple:
+    """
+    Calculate the direction between two coordinates
+    :param lat1: float latitude in degrees (-90.0 to 90.0)
+    :param long1: float longitude in degrees (-180.0 to 180.0)
+    :param lat2: float latitude in degrees (-90.0 to 90.0)
+    :param long2: float longitude in degrees (-180.0 to 180.0)
+    :return: tuple of 3 floats (x, y, z) that points from the first to the second coordinate
+    over the surface of the Earth
+    :throws ValueError if the latitude or longitude are out of range
+    """
+    v = to_vector_scalar(lat1, long1)
+    w = to_vector_scalar(lat2, long2)
+    result = cross3(cross3(v, w), v)
+    if magnitude3(result) < 1:
+        return cross3(cross3(v, (0.0, 0.0, 1.0)), v)
+    return result
+
+
+@njit('float64(float64, float64, float64, float64)', cache=True, fastmath=True)
+def bearing_between_coordinates(lat1: float, long1: float, lat2: float, long2: float) -> float:
+    """
+    Calculate the bearing between two coordinates
+    :param lat1: float latitude in degrees (-90.0 to 90.0)
+    :param long1: float longitude in degrees (-180.0 to 180.0)
+    :param lat2: float latitude in degrees (-90.0 to 90.0)
+    :param long2: float longitude in degrees (-180.0 to 180.0)
+    :return: float bearing in degrees
+    :throws ValueError if the latitude or longitude are out of range
+    """
+    v = to_vector_scalar(lat1, long1)
+    w = to_vector_scalar(lat2, long2)
+    north_vector = cross3(cross3(v, (0.0, 0.0, 1.0)), v)
+    direction = cross3(cross3(v, w), v)
+    if magnitude3(direction) < 1:
+        direction = north_vector
+    bearing = math.degrees(angle_vectors3(direction, north_vector))
+    if long2 < long1:
+        bearing = 360 - bearing
+    return bearing
+
+
+@njit('float64(float64)', cache=True, fastmath=True)
+def elevation(alpha: float) -> float:
+    """
+    Returns the elevation angle in degrees of the ISS
+    :param alpha: float, the angle between points on the earth
+    :return: float: elevation angle in degrees
+    """
+    rh = R + H
+    distance = math.sqrt(R * R + rh * rh - 2 * R * rh * math.cos(alpha))  # Law of cosines
+    gamma = math.asin(math.sin(alpha) * R / distance)  # Law of sines
+    return math.degrees(math.pi / 2 - alpha - gamma)
+
+
+@njit('float64[:](float64, float64, float64[:], float64[:])', cache=True, fastmath=True, parallel=True)
+def elevation_batch(lat: float, long: float, iss_lats: np.ndarray, iss_longs: np.ndarray) -> np.ndarray:
+    """
+    Returns the elevation angles in degrees of a track of ISS positions seen from one location
+    :param lat: float latitude of the observer in degrees (-90.0 to 90.0)
+    :param long: float longitude of the observer in degrees (-180.0 to 180.0)
+    :param iss_lats: array of ISS latitudes in degrees (-90.0 to 90.0), e.g. one per timestamp
+    :param iss_longs: array of ISS longitudes in degrees (-180.0 to 180.0), same length as iss_lats
+    :return: array of elevation angles in degrees
+    :throws ValueError if the latitude or longitude are out of range or the arrays have different lengths
+    """
+    # Validate before the parallel loop: exceptions raised inside prange are not propagated reliably
+    if iss_lats.size != iss_longs.size:
+        raise ValueError('Latitudes and longitudes must have the same length')
+    if lat < -90 or lat > 90 or np.any(iss_lats < -90) or np.any(iss_lats > 90):
+        raise ValueError('Latitude must be between -90 and 90')
+    if long < -180 or long > 180 or np.any(iss_longs < -180) or np.any(iss_longs > 180):
+        raise ValueError('Longitude must be between -180 and 180')
+    v = _to_vector_unchecked(lat, long)
+    result = np.empty(iss_lats.size)
+    for i in prange(iss_lats.size):
+        w = _to_vector_unchecked(iss_lats[i], iss_longs[i])
+        result[i] = elevation(angle_vectors3(v, w))
+    return result
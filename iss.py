@@ -1,9 +1,14 @@
 # Description: This script will get the current location of the ISS
 from math import sqrt, cos, asin, sin, pi, degrees
 
+import numpy as np
 import requests
 import geo
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+
+ISS_HEIGHT = 408  # The height of the ISS in Km
 
 
 def elevation(alpha: float) -> float:
@@ -12,23 +17,54 @@ def elevation(alpha: float) -> float:
     :param alpha: float, the angle between points on the earth
     :return: float: elevation angle in degrees
     """
-    r = 6371  # The radius of Earth in Km
-    h = 408  # The high of the ISS
-    distance = sqrt(r ** 2 + (r+h) ** 2 - 2 * r * (r+h) * cos(alpha))  # Law of cosines
+    r = geo.R
+    rh = r + ISS_HEIGHT
+    distance = sqrt(r * r + rh * rh - 2 * r * rh * cos(alpha))  # Law of cosines
     gamma = asin(sin(alpha)*r/distance)  # Law of sines
     return degrees(pi/2 - alpha - gamma)
 
 
+def elevation_batch(alphas: np.ndarray) -> np.ndarray:
+    """
+    Returns the elevation angles in degrees of the ISS for an array of angles
+    :param alphas: array of floats, the angles between points on the earth
+    :return: array of floats: elevation angles in degrees
+    """
+    alphas = np.asarray(alphas, dtype=np.float64)
+    r = geo.R
+    rh = r + ISS_HEIGHT
+    distance = np.sqrt(r * r + rh * rh - 2 * r * rh * np.cos(alphas))  # Law of cosines
+    gamma = np.arcsin(np.sin(alphas) * r / distance)  # Law of sines
+    return np.degrees(np.pi / 2 - alphas - gamma)
+
+
 def to_timestamp(utc_time: str) -> int:
     """
     Convert a UTC time to a timestamp
     :param utc_time: str, time in the format 'HH:MM:SS AM/PM'
     :return: int, timestamp in seconds
     """
-    today = datetime.utcnow()
-    time = (datetime
-            .strptime(utc_time, '%I:%M:%S %p')
-            .replace(year=today.year, month=today.month, day=today.day))
+    return _timestamp_on(datetime.utcnow().date(), utc_time)
+
+
+@lru_cache(maxsize=2)
+def _timestamp_on(day: date, utc_time: str) -> int:
+    """
+    Convert a UTC time on a given day to a timestamp, memoized since sunrise and sunset only change daily
+    :param day: date, the UTC day
+    :param utc_time: str, time in the format 'HH:MM:SS AM/PM'
+    :return: int, timestamp in seconds
+    :throws ValueError if the time does not match the format
+    """
+    # Hand-parsed because the format is fixed and strptime is slow; the hour may have one or two digits
+    clock, meridiem = utc_time.split()
+    hours, minutes, seconds = (int(part) for part in clock.split(':'))
+    if not 1 <= hours <= 12 or meridiem not in ('AM', 'PM'):
+        raise ValueError(f"time data '{utc_time}' does not match format 'HH:MM:SS AM/PM'")
+    hours %= 12
+    if meridiem == 'PM':
+        hours += 12
+    time = datetime(day.year, day.month, day.day, hours, minutes, seconds)
     return int(time.timestamp())
 
 
@@ -52,14 +88,20 @@ my_latitude = 38.511883729973015
 my_longitude = -0.23174407854098136
 
 try:
-    response_iss = requests.get(url_iss)
+    # Both endpoints are independent hosts, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future_iss = executor.submit(requests.get, url_iss)
+        future_sun = executor.submit(requests.get, url_sun, params={'lat': my_latitude, 'lng': my_longitude})
+        response_iss = future_iss.result()
+        response_sun = future_sun.result()
     response_iss.raise_for_status()
-    response_sun = requests.get(url_sun, params={'lat': my_latitude, 'lng': my_longitude})
     response_sun.raise_for_status()
-    iss_latitude = float(response_iss.json()['iss_position']['latitude'])
-    iss_longitude = float(response_iss.json()['iss_position']['longitude'])
-    sunrise = response_sun.json()['results']['sunrise']
-    sunset = response_sun.json()['results']['sunset']
+    iss_position = response_iss.json()['iss_position']
+    sun_results = response_sun.json()['results']
+    iss_latitude = float(iss_position['latitude'])
+    iss_longitude = float(iss_position['longitude'])
+    sunrise = sun_results['sunrise']
+    sunset = sun_results['sunset']
     angle = geo.angle_between_coordinates(my_latitude, my_longitude, iss_latitude, iss_longitude)
     elevation_angle = elevation(angle)
     azimuth = geo.bearing_between_coordinates(my_latitude, my_longitude, iss_latitude, iss_longitude)
@@ -1,7 +1,9 @@
 import unittest
 import geo
+import geo_fast
 import math
 import iss
+import numpy as np
 from datetime import datetime
 
 
@@ -33,6 +35,19 @@ class TestGeo(unittest.TestCase):
             for c, e in zip(calculated, expected):
                 self.assertAlmostEqual(c, e, places=1)
 
+    def test_to_vector_batch(self):
+        lats = [0, 0, 90, 90, 15]
+        longs = [0, 90, 0, 90, -28]
+        calculated = geo.to_vector_batch(lats, longs)
+        self.assertEqual(calculated.shape, (5, 3))
+        for row, lat, long in zip(calculated, lats, longs):
+            for c, e in zip(row, geo.to_vector(lat, long)):
+                self.assertAlmostEqual(c, e, places=6)
+        with self.assertRaises(ValueError):
+            geo.to_vector_batch([91], [0])
+        with self.assertRaises(ValueError):
+            geo.to_vector_batch([0], [-181])
+
     def test_angle_vectors(self):
         cases = [
             ((1, 0, 0), (0, 1, 0), 90 * math.pi / 180),
@@ -45,6 +60,9 @@ class TestGeo(unittest.TestCase):
         ]
         for v, w, expected in cases:
             self.assertAlmostEqual(geo.angle_vectors(v, w), expected, places=1)
+        # Nearby points: acos of the cosine would collapse this to 0
+        self.assertAlmostEqual(geo.angle_vectors((1, 0, 0), (1, 1e-9, 0)), 1e-9, places=15)
+        self.assertAlmostEqual(geo.angle_vectors((1, 2), (3, 4)), math.atan2(2, 11), places=6)
 
     def test_angle_between_coordinates(self):
         cases = [
@@ -57,6 +75,46 @@ class TestGeo(unittest.TestCase):
         for lat1, long1, lat2, long2, expected in cases:
             self.assertAlmostEqual(geo.angle_between_coordinates(lat1, long1, lat2, long2), expected, places=1)
 
+    def test_to_coord_buffer(self):
+        lats = [0, 90, 15]
+        longs = [90, 0, -28]
+        buffer = geo.to_coord_buffer(lats, longs)
+        for x, y, z, lat, long in zip(buffer.x, buffer.y, buffer.z, lats, longs):
+            for c, e in zip((x, y, z), geo.to_vector(lat, long)):
+                self.assertAlmostEqual(c, e, places=6)
+
+    def test_angle_between_coordinates_batch(self):
+        cases = [
+            (0, 0, 0, 0, 0),
+            (0, 0, 0, 90, math.pi / 2),
+            (0, 0, 0, 180, math.pi),
+            (45, 0, 45, 90, math.pi / 3),
+            (45, 0, 45, -90, math.pi / 3)
+        ]
+        lats1, longs1, lats2, longs2, expected = zip(*cases)
+        a = geo.to_coord_buffer(lats1, longs1)
+        b = geo.to_coord_buffer(lats2, longs2)
+        for c, e in zip(geo.angle_between_coordinates_batch(a, b), expected):
+            self.assertAlmostEqual(c, e, places=6)
+
+    def test_distance_between_coordinates_batch(self):
+        a = geo.to_coord_buffer([0], [0])
+        b = geo.to_coord_buffer([0, 0, 45, 1e-5], [0, 90, 90, 0])
+        points = [(0, 0), (0, 90), (45, 90), (1e-5, 0)]
+        expected = [geo.distance_between_coordinates(0, 0, lat, long) for lat, long in points]
+        for c, e in zip(geo.distance_between_coordinates_batch(a, b), expected):
+            self.assertAlmostEqual(c, e, places=4)
+        self.assertAlmostEqual(geo.distance_between_coordinates_batch(a, b)[3] / expected[3], 1, places=9)
+
+    def test_distances_to_points(self):
+        points = [(0, 0), (0, 90), (0, 180), (45, 90), (-45, -90), (45.00001, 0)]
+        lats, longs = zip(*points)
+        calculated = geo.distances_to_points(45, 0, lats, longs)
+        self.assertEqual(calculated.shape, (6,))
+        for c, (lat, long) in zip(calculated, points):
+            self.assertAlmostEqual(c, geo.distance_between_coordinates(45, 0, lat, long), places=4)
+        self.assertAlmostEqual(calculated[5] / geo.distance_between_coordinates(45, 0, 45.00001, 0), 1, places=9)
+
     def test_distance_between_coordinates(self):
         cases = [
             (0, 0, 0, 0, 0),
@@ -100,7 +158,8 @@ class TestGeo(unittest.TestCase):
             (45, 'NE'),
             (135, 'SE'),
             (225, 'SW'),
-            (315, 'NW')
+            (315, 'NW'),
+            (350, 'N')
         ]
         for angle, expected in cases:
             self.assertEqual(geo.cardinal_from_angle(angle), expected)
@@ -115,12 +174,20 @@ class TestIss(unittest.TestCase):
         for alpha, expected in cases:
             self.assertAlmostEqual(iss.elevation(alpha), expected, places=1)
 
+    def test_elevation_batch(self):
+        alphas = np.array([0, 10 * math.pi / 180, 20 * math.pi / 180])
+        calculated = iss.elevation_batch(alphas)
+        for c, alpha in zip(calculated, alphas):
+            self.assertAlmostEqual(c, iss.elevation(alpha), places=6)
+
     def test_to_timestamp(self):
         cases = [
             ('12:00:00 AM', 0),
             ('12:00:00 PM', 43200),
             ('06:00:00 AM', 21600),
-            ('06:00:00 PM', 64800)
+            ('06:00:00 PM', 64800),
+            ('7:27:02 AM', 26822),
+            ('11:59:59 PM', 86399)
         ]
         today = datetime.utcnow()
         for time, expected in cases:
@@ -129,3 +196,81 @@ class TestIss(unittest.TestCase):
                     .strptime(time, '%I:%M:%S %p')
                     .replace(year=today.year, month=today.month, day=today.day))
             self.assertEqual(calculated, int(time.timestamp()))
+        for time in ['13:00:00 PM', '06:00:00 XM', '06:00 AM', '06:61:00 AM']:
+            with self.assertRaises(ValueError):
+                iss.to_timestamp(time)
+
+
+class TestGeoFast(unittest.TestCase):
+    def test_vector_kernels(self):
+        self.assertAlmostEqual(geo_fast.magnitude3((1.0, 1.0, 1.0)), 1.7320508075688772)
+        self.assertAlmostEqual(geo_fast.dot3((1.0, 2.0, 3.0), (4.0, 5.0, 6.0)), 32)
+        self.assertEqual(geo_fast.cross3((1.0, 0.0, 0.0), (0.0, 1.0, 0.0)), (0, 0, 1))
+
+    def test_to_vector_scalar(self):
+        for lat, long in [(0, 0), (90, 90), (15, -28)]:
+            calculated = geo_fast.to_vector_scalar(lat, long)
+            for c, e in zip(calculated, geo.to_vector(lat, long)):
+                self.assertAlmostEqual(c, e, places=6)
+        with self.assertRaises(ValueError):
+            geo_fast.to_vector_scalar(91, 0)
+
+    def test_angle_between_coordinates(self):
+        cases = [
+            (0, 0, 0, 90, math.pi / 2),
+            (0, 0, 0, 180, math.pi),
+            (45, 0, 45, -90, math.pi / 3)
+        ]
+        for lat1, long1, lat2, long2, expected in cases:
+            self.assertAlmostEqual(geo_fast.angle_between_coordinates(lat1, long1, lat2, long2), expected, places=6)
+
+    def test_angle_vectors3(self):
+        cases = [
+            ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0)),
+            ((1.0, 0.0, 0.0), (-1.0, 0.0, 0.0)),
+            ((-2.0, -5.0, 7.0), (1.0, 2.0, 3.0)),
+            ((0.0, 0.0, 0.0), (1.0, 2.0, 3.0))
+        ]
+        for v, w in cases:
+            self.assertAlmostEqual(geo_fast.angle_vectors3(v, w), geo.angle_vectors(v, w), places=6)
+
+    def test_direction_and_bearing_between_coordinates(self):
+        cases = [
+            (0, 0, 0, 0),
+            (0, 0, 0, 90),
+            (0, 0, 0, 180),
+            (45, 0, 45, 90),
+            (45, 0, 45, -90),
+            (38.5, -0.2, 51.6, 20.3)
+        ]
+        for lat1, long1, lat2, long2 in cases:
+            calculated = geo_fast.direction_between_coordinates(lat1, long1, lat2, long2)
+            expected = geo.direction_between_coordinates(lat1, long1, lat2, long2)
+            for c, e in zip(calculated, expected):
+                self.assertAlmostEqual(c / geo.R ** 3, e / geo.R ** 3, places=6)
+            self.assertAlmostEqual(geo_fast.bearing_between_coordinates(lat1, long1, lat2, long2),
+                                   geo.bearing_between_coordinates(lat1, long1, lat2, long2), places=4)
+
+    def test_elevation(self):
+        self.assertAlmostEqual(geo_fast.elevation(10 * math.pi / 180), iss.elevation(10 * math.pi / 180), places=6)
+        self.assertAlmostEqual(geo_fast.elevation(0), 90, places=6)
+
+    def test_elevation_batch(self):
+        lats = np.array([38.5, 40.0, -10.0])
+        longs = np.array([-0.2, 5.0, 100.0])
+        calculated = geo_fast.elevation_batch(38.5, -0.2, lats, longs)
+        for c, lat, long in zip(calculated, lats, longs):
+            expected = iss.elevation(geo.angle_between_coordinates(38.5, -0.2, lat, long))
+            self.assertAlmostEqual(c, expected, places=4)
+
+    def test_elevation_batch_out_of_range(self):
+        cases = [
+            (38.5, -0.2, np.array([95.0, 10.0]), np.array([0.0, 0.0])),
+            (38.5, -0.2, np.array([10.0, 10.0]), np.array([0.0, -181.0])),
+            (95.0, -0.2, np.full(4, 10.0), np.zeros(4)),
+            (38.5, 181.0, np.full(4, 10.0), np.zeros(4)),
+            (38.5, -0.2, np.zeros(2), np.zeros(3))
+        ]
+        for lat, long, iss_lats, iss_longs in cases:
+            with self.assertRaises(ValueError):
+                geo_fast.elevation_batch(lat, long, iss_lats, iss_longs)